@@ -1,9 +1,12 @@
+from dataclasses import asdict
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
-from nlp import get_nlp
+from nlp import memory_metrics, nlp_session
 from nlp.consistency import check_consistency, consistency_issues_to_dicts
 from nlp.enhancement import get_enhancement_edits, apply_edits, edit_records_to_log
+from nlp.rules import get_rules
 from nlp.style import apply_style, style_edits_to_log
 
 from schemas import (
@@ -13,6 +16,7 @@ from schemas import (
     EnhanceRequest,
     EnhanceResponse,
     EditItem,
+    MemoryMetricsResponse,
 )
 
 app = FastAPI(
@@ -21,6 +25,9 @@ app = FastAPI(
     version="0.1.0",
 )
 
+# Compile rule artifacts (lexicons, fillers, names) once at startup; shared read-only afterwards.
+_RULES = get_rules()
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -35,7 +42,13 @@ app.add_middleware(
 
 @app.get("/health")
 def health():
-    return {"status": "ok"}
+    return {"status": "ok", "rules_version": _RULES.version}
+
+
+@app.get("/metrics", response_model=MemoryMetricsResponse)
+def metrics():
+    """Memory metrics for the shared spaCy pipeline (vocab, string store, RSS, recycles)."""
+    return MemoryMetricsResponse(**asdict(memory_metrics()))
 
 
 # --- Wired endpoints (Phase 5): real NLP pipelines ---
@@ -68,8 +81,8 @@ def analyze(request: AnalyzeRequest):
     if len(request.text) > _MAX_TEXT_LENGTH:
         raise HTTPException(400, f"Text exceeds maximum length ({_MAX_TEXT_LENGTH} characters).")
 
-    nlp = get_nlp()
-    issues = check_consistency(request.text, nlp)
+    with nlp_session() as nlp:
+        issues = check_consistency(request.text, nlp)
     issue_dicts = consistency_issues_to_dicts(issues)
 
     tense_issues = [i for i in issues if i.type == "tense"]
@@ -92,19 +105,19 @@ def enhance(request: EnhanceRequest):
     if len(request.text) > _MAX_TEXT_LENGTH:
         raise HTTPException(400, f"Text exceeds maximum length ({_MAX_TEXT_LENGTH} characters).")
 
-    nlp = get_nlp()
     text = request.text
     edit_log: list[dict] = []
 
-    # 1. Consistency fixes (pronoun suggestions, etc.)
-    issues = check_consistency(text, nlp)
-    fix_records = _consistency_fixes_to_edit_records(issues)
-    if fix_records:
-        edit_log.extend(edit_records_to_log(text, fix_records, "REPLACE"))
-        text = apply_edits(text, fix_records)
+    with nlp_session() as nlp:
+        # 1. Consistency fixes (pronoun suggestions, etc.)
+        issues = check_consistency(text, nlp)
+        fix_records = _consistency_fixes_to_edit_records(issues)
+        if fix_records:
+            edit_log.extend(edit_records_to_log(text, fix_records, "REPLACE"))
+            text = apply_edits(text, fix_records)
 
-    # 2. Enhancement (repetition, etc.)
-    enh_records = get_enhancement_edits(text, nlp, request.enhancement_level)
+        # 2. Enhancement (repetition, etc.)
+        enh_records = get_enhancement_edits(text, nlp, request.enhancement_level)
     if enh_records:
         edit_log.extend(edit_records_to_log(text, enh_records, "REPLACE"))
         text = apply_edits(text, enh_records)
@@ -1,18 +1,25 @@
 """
-NLP package: spaCy model loaded once at startup.
+NLP package: spaCy model loaded once and shared; recycled when memory limits are crossed.
 All logic here is custom (rules + spaCy for NER/tokens/deps); no LLM.
 """
-import spacy
+from .memory import MemoryMetrics, PipelineManager
 
-_nlp = None
+_manager = PipelineManager()
 
 
 def get_nlp():
-    """Load and cache spaCy model (en_core_web_sm)."""
-    global _nlp
-    if _nlp is None:
-        _nlp = spacy.load("en_core_web_sm")
-    return _nlp
+    """Return the shared spaCy model (en_core_web_sm), loading it on first use."""
+    return _manager.get()
 
 
-__all__ = ["get_nlp"]
+def nlp_session():
+    """Context manager yielding the pipeline for one request, pinned so a recycle cannot swap it mid-request."""
+    return _manager.lease()
+
+
+def memory_metrics() -> MemoryMetrics:
+    """Vocab/string-store size, RSS and recycle counters for the shared pipeline."""
+    return _manager.metrics()
+
+
+__all__ = ["get_nlp", "nlp_session", "memory_metrics", "MemoryMetrics"]
@@ -7,8 +7,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+from .rules import get_rules
+
 # Common first names -> typical grammatical gender for pronoun check (incomplete; extend as needed).
 # Used only to flag likely mismatches (e.g. "Rahul ... She").
+# NAME_TO_GENDER and the pronoun sets are inputs to nlp/rules.py; checks read the compiled copies via
+# get_rules(), so edits take effect on restart, not by mutating these at runtime.
 NAME_TO_GENDER: dict[str, str] = {
     "rahul": "male", "arjun": "male", "raj": "male", "amit": "male",
     "john": "male", "james": "male", "michael": "male", "david": "male",
@@ -54,6 +58,10 @@ def _normalize_tense(t: str | None) -> str | None:
 
 def check_consistency(text: str, nlp) -> list[ConsistencyIssueResult]:
     """Run all consistency checks; return list of issues with character spans."""
+    rules = get_rules()
+    name_to_gender = rules.name_to_gender
+    male_pronouns = rules.male_pronouns
+    female_pronouns = rules.female_pronouns
     doc = nlp(text)
     issues: list[ConsistencyIssueResult] = []
     seen_names_in_doc: dict[str, str] = {}  # name -> gender once we've seen it
@@ -78,17 +86,17 @@ def check_consistency(text: str, nlp) -> list[ConsistencyIssueResult]:
 
         # Update global name->gender from known list (first occurrence)
         for name_lower, _s, _e in persons_in_sent:
-            if name_lower not in seen_names_in_doc and name_lower in NAME_TO_GENDER:
-                seen_names_in_doc[name_lower] = NAME_TO_GENDER[name_lower]
+            if name_lower not in seen_names_in_doc and name_lower in name_to_gender:
+                seen_names_in_doc[name_lower] = name_to_gender[name_lower]
 
         # In this sentence, check pronouns
         for token in sent:
             low = token.lower_
-            if low in MALE_PRONOUNS or low in FEMALE_PRONOUNS:
+            if low in male_pronouns or low in female_pronouns:
                 # Prefer antecedent from same sentence, then previous sentence
                 antecedent_gender: str | None = None
                 for name_lower, _s, _e in persons_in_sent:
-                    antecedent_gender = seen_names_in_doc.get(name_lower) or NAME_TO_GENDER.get(name_lower)
+                    antecedent_gender = seen_names_in_doc.get(name_lower) or name_to_gender.get(name_lower)
                     break
                 if antecedent_gender is None and i > 0:
                     # Use last PERSON / PROPN from previous sentence
@@ -96,17 +104,17 @@ def check_consistency(text: str, nlp) -> list[ConsistencyIssueResult]:
                     for ent in prev.ents:
                         if ent.label_ == "PERSON":
                             name_lower = ent.text.strip().lower()
-                            antecedent_gender = seen_names_in_doc.get(name_lower) or NAME_TO_GENDER.get(name_lower)
+                            antecedent_gender = seen_names_in_doc.get(name_lower) or name_to_gender.get(name_lower)
                             break
                     if antecedent_gender is None:
                         for t in prev:
                             if t.pos_ == "PROPN" and t.text and t.text[0].isupper():
                                 name_lower = t.text.lower()
-                                antecedent_gender = NAME_TO_GENDER.get(name_lower)
+                                antecedent_gender = name_to_gender.get(name_lower)
                                 break
                 if antecedent_gender:
                     expect_male = antecedent_gender == "male"
-                    if expect_male and low in FEMALE_PRONOUNS:
+                    if expect_male and low in female_pronouns:
                         issues.append(ConsistencyIssueResult(
                             type="pronoun",
                             start=token.idx,
@@ -115,7 +123,7 @@ def check_consistency(text: str, nlp) -> list[ConsistencyIssueResult]:
                             original=token.text,
                             suggestion="he" if low == "she" else "him" if low == "her" else "his",
                         ))
-                    elif not expect_male and low in MALE_PRONOUNS:
+                    elif not expect_male and low in male_pronouns:
                         issues.append(ConsistencyIssueResult(
                             type="pronoun",
                             start=token.idx,
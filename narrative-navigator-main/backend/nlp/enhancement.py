@@ -8,9 +8,12 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
+from .rules import get_rules
+
 # --- Repetition patterns (custom rules) ---
 CONSECUTIVE_DUPLICATES = re.compile(r"\b(\w+)\s+\1\b", re.IGNORECASE)
 # "very very" -> "very", "had had" is valid, so we'll allow 2+ same word and suggest dedup only for known fillers
+# Input to nlp/rules.py; read via get_rules().fillers, so edits take effect on restart.
 FILLER_DUPLICATES = {"very", "really", "quite", "just", "so", "actually", "literally", "basically"}
 
 
@@ -26,13 +29,14 @@ class EditRecord:
 def _find_repetition_edits(text: str) -> list[EditRecord]:
     """Find repeated consecutive words (e.g. 'very very') and suggest single occurrence."""
     edits: list[EditRecord] = []
+    fillers = get_rules().fillers
     for m in CONSECUTIVE_DUPLICATES.finditer(text):
         word = m.group(1).lower()
         # Suggest removing duplicate; keep one
         dup_span = m.group(0)
         single = m.group(1)
         # "very very" -> "very"
-        if word in FILLER_DUPLICATES:
+        if word in fillers:
             edits.append(EditRecord(
                 start=m.start(),
                 end=m.end(),
@@ -0,0 +1,246 @@
+"""
+Pipeline lifecycle for long-running workers: per-request leases, memory metrics, recycling.
+spaCy's Vocab/StringStore keeps every new string it sees, so a shared pipeline grows for the
+lifetime of the process. When the vocab or string-store limit is crossed, a fresh pipeline is
+loaded in the background and swapped in; requests already holding the old one finish on it, and
+it is dropped once its last lease is released. No request is ever interrupted.
+
+Process RSS is only reported: swapping the pipeline does not give memory back to the OS, so an
+RSS breach acts only in worker-recycle mode (graceful restart by gunicorn).
+"""
+from __future__ import annotations
+
+import gc
+import logging
+import os
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
+import spacy
+
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = "en_core_web_sm"
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+
+# --- Thresholds (0 disables a limit). Override via environment. ---
+MAX_STRINGS = _env_int("NN_MAX_STRINGS", 1_000_000)
+MAX_VOCAB = _env_int("NN_MAX_VOCAB", 500_000)
+MAX_RSS_MB = _env_int("NN_MAX_RSS_MB", 0)
+# Minimum requests served by a pipeline before it can be recycled (avoids reload thrash).
+MIN_REQUESTS_BEFORE_RECYCLE = _env_int("NN_RECYCLE_MIN_REQUESTS", 100)
+# Seconds to wait before retrying after a failed reload.
+RELOAD_RETRY_SECONDS = _env_int("NN_RECYCLE_RETRY_SECONDS", 300)
+# If set, an RSS breach asks gunicorn for a graceful worker restart. Only honoured when this
+# process is a gunicorn worker (see _under_gunicorn). uvicorn --workers is not supported: before
+# 0.30 its supervisor does not replace a worker that exits.
+RECYCLE_WORKER_ON_RSS = bool(_env_int("NN_RECYCLE_WORKER", 0))
+
+
+def current_rss_bytes() -> int | None:
+    """Resident set size of this process, or None where /proc is unavailable (e.g. Windows, macOS)."""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _under_gunicorn() -> bool:
+    """True if the parent process is a gunicorn master, which replaces workers that exit."""
+    try:
+        with open(f"/proc/{os.getppid()}/cmdline", "rb") as f:
+            args = [a.decode("utf-8", "replace") for a in f.read().split(b"\0") if a]
+    except OSError:
+        return False
+    if not args:
+        return False
+    # With setproctitle installed the master renames itself to "gunicorn: master [main:app]".
+    if args[0].startswith("gunicorn"):
+        return True
+    # Otherwise: the executable or script (python .../bin/gunicorn), or the module after -m.
+    programs = {os.path.basename(a) for a in args[:2]}
+    if "-m" in args[:-1]:
+        programs.add(args[args.index("-m") + 1])
+    return "gunicorn" in programs
+
+
+def _rss_over_limit(rss: int | None) -> bool:
+    return bool(MAX_RSS_MB) and rss is not None and rss > MAX_RSS_MB * 1024 * 1024
+
+
+@dataclass
+class MemoryMetrics:
+    generation: int
+    vocab_size: int
+    string_store_size: int
+    rss_bytes: int | None
+    rss_limit_exceeded: bool
+    in_flight: int
+    retired_pipelines: int
+    recycles: int
+    reload_failures: int
+    last_recycle_reason: str | None
+
+
+@dataclass
+class _Generation:
+    nlp: Any
+    number: int
+    leases: int = 0
+    requests: int = 0
+
+
+class PipelineManager:
+    """Owns the shared pipeline; swaps in a fresh one when vocab/string-store limits are crossed."""
+
+    def __init__(self, loader: Callable[[], Any] | None = None):
+        self.loader = loader or (lambda: spacy.load(MODEL_NAME))
+        self._lock = threading.Lock()
+        self._current: _Generation | None = None
+        self._retired: list[_Generation] = []
+        self._reloading = False
+        self._retry_after = 0.0
+        self._recycles = 0
+        self._reload_failures = 0
+        self._rss_exceeded = False  # last observed state, so the warning is logged once per crossing
+        self._last_reason: str | None = None
+        self._recycle_worker = RECYCLE_WORKER_ON_RSS
+        if self._recycle_worker and not _under_gunicorn():
+            logger.warning(
+                "NN_RECYCLE_WORKER ignored: not running as a gunicorn worker, "
+                "so SIGTERM could stop the worker for good instead of restarting it."
+            )
+            self._recycle_worker = False
+
+    def _ensure_current(self) -> _Generation:
+        """Caller holds the lock."""
+        if self._current is None:
+            self._current = _Generation(nlp=self.loader(), number=0)
+        return self._current
+
+    def get(self):
+        """Current pipeline (not pinned; may be replaced by a recycle while the caller uses it)."""
+        with self._lock:
+            return self._ensure_current().nlp
+
+    @contextmanager
+    def lease(self) -> Iterator[Any]:
+        """Pin the current pipeline generation for one request; check limits on exit."""
+        with self._lock:
+            gen = self._ensure_current()
+            gen.leases += 1
+            gen.requests += 1
+        try:
+            yield gen.nlp
+        finally:
+            with self._lock:
+                gen.leases -= 1
+                if gen is not self._current and gen.leases == 0 and gen in self._retired:
+                    self._retired.remove(gen)
+                is_current = gen is self._current
+            if is_current:
+                self.maybe_recycle()
+
+    def metrics(self) -> MemoryMetrics:
+        with self._lock:
+            gen = self._ensure_current()
+            in_flight = gen.leases + sum(g.leases for g in self._retired)
+            rss = current_rss_bytes()
+            return MemoryMetrics(
+                generation=gen.number,
+                vocab_size=len(gen.nlp.vocab),
+                string_store_size=len(gen.nlp.vocab.strings),
+                rss_bytes=rss,
+                rss_limit_exceeded=_rss_over_limit(rss),
+                in_flight=in_flight,
+                retired_pipelines=len(self._retired),
+                recycles=self._recycles,
+                reload_failures=self._reload_failures,
+                last_recycle_reason=self._last_reason,
+            )
+
+    def _vocab_breach(self, gen: _Generation) -> str | None:
+        strings = len(gen.nlp.vocab.strings)
+        if MAX_STRINGS and strings > MAX_STRINGS:
+            return f"string store size {strings} > {MAX_STRINGS}"
+        vocab = len(gen.nlp.vocab)
+        if MAX_VOCAB and vocab > MAX_VOCAB:
+            return f"vocab size {vocab} > {MAX_VOCAB}"
+        return None
+
+    def _rss_breach(self) -> str | None:
+        """Caller holds the lock. Warns once each time RSS crosses the limit."""
+        if not MAX_RSS_MB:
+            return None
+        rss = current_rss_bytes()
+        exceeded = _rss_over_limit(rss)
+        if exceeded and not self._rss_exceeded:
+            logger.warning("RSS %d MB exceeds NN_MAX_RSS_MB=%d.", rss // (1024 * 1024), MAX_RSS_MB)
+        self._rss_exceeded = exceeded
+        return f"RSS {rss // (1024 * 1024)} MB > {MAX_RSS_MB} MB" if exceeded else None
+
+    def maybe_recycle(self) -> str | None:
+        """Start a background reload or worker restart if a limit is crossed. Returns the reason, or None."""
+        with self._lock:
+            gen = self._current
+            rss_reason = self._rss_breach()
+            if gen is None or self._reloading or gen.requests < MIN_REQUESTS_BEFORE_RECYCLE:
+                return None
+            if rss_reason and self._recycle_worker:
+                self._reloading = True
+                self._last_reason = rss_reason
+                restart_worker = True
+            else:
+                if time.monotonic() < self._retry_after:
+                    return None
+                reason = self._vocab_breach(gen)
+                if reason is None:
+                    return None
+                self._reloading = True
+                self._last_reason = reason
+                restart_worker = False
+        if restart_worker:
+            logger.warning("%s; sending SIGTERM for a graceful worker restart.", rss_reason)
+            # The manager drains in-flight requests on SIGTERM and starts a replacement worker.
+            os.kill(os.getpid(), signal.SIGTERM)
+            return rss_reason
+        logger.info("Recycling spaCy pipeline: %s.", reason)
+        threading.Thread(target=self._reload, name="nlp-reload", daemon=True).start()
+        return reason
+
+    def _reload(self) -> None:
+        try:
+            fresh = self.loader()
+        except Exception as exc:
+            logger.exception("Reloading spaCy pipeline failed; retrying in %d s.", RELOAD_RETRY_SECONDS)
+            with self._lock:
+                self._reload_failures += 1
+                self._last_reason = f"reload failed: {exc}"
+                self._retry_after = time.monotonic() + RELOAD_RETRY_SECONDS
+                self._reloading = False
+            return
+        with self._lock:
+            old = self._current
+            self._current = _Generation(nlp=fresh, number=old.number + 1 if old else 0)
+            if old is not None and old.leases:
+                self._retired.append(old)
+            self._recycles += 1
+            self._reloading = False
+        del old
+        gc.collect()
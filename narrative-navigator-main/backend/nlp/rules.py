@@ -0,0 +1,103 @@
+"""
+Compiled rule artifacts: style lexicons, filler list, name and pronoun lexicons.
+Built once from the source maps in style.py / enhancement.py / consistency.py, then shared
+read-only. The artifact version is a content hash of the source data; include it in any cache key
+derived from rule output so edits to a lexicon invalidate stale entries.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+# Bump when the compiled layout changes (independent of lexicon content).
+_ARTIFACT_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class LexiconEntry:
+    key: str  # lowercased, for the cheap substring pre-check
+    pattern: re.Pattern
+    replacement: str
+
+
+@dataclass(frozen=True)
+class CompiledLexicon:
+    """One style lexicon: whole-word patterns, longest phrase first (e.g. "a lot of" before "a lot")."""
+    entries: tuple[LexiconEntry, ...]
+
+
+@dataclass(frozen=True)
+class RuleArtifacts:
+    version: str
+    styles: Mapping[str, CompiledLexicon]
+    fillers: frozenset[str]
+    name_to_gender: Mapping[str, str]
+    male_pronouns: frozenset[str]
+    female_pronouns: frozenset[str]
+
+
+def _compile_lexicon(mapping: dict[str, str]) -> CompiledLexicon:
+    items = sorted(mapping.items(), key=lambda x: -len(x[0]))
+    return CompiledLexicon(entries=tuple(
+        LexiconEntry(
+            key=original.lower(),
+            pattern=re.compile(r"\b" + re.escape(original) + r"\b", re.IGNORECASE),
+            replacement=modified,
+        )
+        for original, modified in items
+    ))
+
+
+def _version(source: dict) -> str:
+    digest = hashlib.sha256(json.dumps(source, sort_keys=True).encode("utf-8")).hexdigest()
+    return f"{_ARTIFACT_FORMAT}-{digest[:12]}"
+
+
+def build_rules() -> RuleArtifacts:
+    """Compile every lexicon into its runtime form. Called once via get_rules()."""
+    # Imported here: those modules read the compiled artifacts through get_rules().
+    from .consistency import FEMALE_PRONOUNS, MALE_PRONOUNS, NAME_TO_GENDER
+    from .enhancement import FILLER_DUPLICATES
+    from .style import (
+        ACADEMIC_MAP, CASUAL_MAP, FORMAL_MAP, PERSUASIVE_MAP, PERSUASIVE_STRENGTH, STORYTELLING_MAP,
+    )
+
+    style_maps = {
+        "formal": FORMAL_MAP,
+        "casual": CASUAL_MAP,
+        "academic": ACADEMIC_MAP,
+        "storytelling": STORYTELLING_MAP,
+        "persuasive": {**PERSUASIVE_MAP, **PERSUASIVE_STRENGTH},
+    }
+    source = {
+        "styles": style_maps,
+        "fillers": sorted(FILLER_DUPLICATES),
+        "names": NAME_TO_GENDER,
+        "pronouns": {
+            "male": sorted(MALE_PRONOUNS),
+            "female": sorted(FEMALE_PRONOUNS),
+        },
+    }
+    return RuleArtifacts(
+        version=_version(source),
+        styles=MappingProxyType({name: _compile_lexicon(m) for name, m in style_maps.items()}),
+        fillers=frozenset(FILLER_DUPLICATES),
+        name_to_gender=MappingProxyType(dict(NAME_TO_GENDER)),
+        male_pronouns=frozenset(MALE_PRONOUNS),
+        female_pronouns=frozenset(FEMALE_PRONOUNS),
+    )
+
+
+_rules: RuleArtifacts | None = None
+
+
+def get_rules() -> RuleArtifacts:
+    """Build (first call) and return the shared rule artifacts."""
+    global _rules
+    if _rules is None:
+        _rules = build_rules()
+    return _rules
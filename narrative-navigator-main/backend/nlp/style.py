@@ -4,10 +4,11 @@ Lexicons and substitutions only; no LLM. Returns transformed text + list of (ori
 """
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from typing import Literal
 
+from .rules import CompiledLexicon, get_rules
+
 StyleKind = Literal["neutral", "formal", "casual", "academic", "storytelling", "persuasive"]
 
 # --- Lexicons: word/phrase -> replacement for each style (custom rules) ---
@@ -74,22 +75,16 @@ class StyleEditRecord:
     reason: str
 
 
-def _word_boundary_regex(word: str) -> re.Pattern:
-    """Match whole word (case-insensitive)."""
-    return re.compile(r"\b" + re.escape(word) + r"\b", re.IGNORECASE)
-
-
-def _apply_lexicon(text: str, mapping: dict[str, str], style_name: str) -> tuple[str, list[StyleEditRecord]]:
+def _apply_lexicon(text: str, lexicon: CompiledLexicon, style_name: str) -> tuple[str, list[StyleEditRecord]]:
     """Apply word substitutions; return (new_text, list of edits with reason)."""
     result = text
+    lowered = result.lower()
     edits: list[StyleEditRecord] = []
-    # Sort by length desc so longer phrases are replaced first (e.g. "a lot of" before "a lot")
-    items = sorted(mapping.items(), key=lambda x: -len(x[0]))
-    for original, modified in items:
-        if original.lower() not in result.lower():
+    for entry in lexicon.entries:
+        if entry.key not in lowered:
             continue
-        pattern = _word_boundary_regex(original)
-        for m in pattern.finditer(result):
+        modified = entry.replacement
+        for m in entry.pattern.finditer(result):
             snippet = result[m.start() : m.end()]
             replacement = modified.capitalize() if snippet[0].isupper() else modified
             edits.append(StyleEditRecord(
@@ -100,7 +95,8 @@ def _apply_lexicon(text: str, mapping: dict[str, str], style_name: str) -> tuple
         def repl(m):
             s = m.group(0)
             return modified.capitalize() if s and s[0].isupper() else modified
-        result = pattern.sub(repl, result)
+        result = entry.pattern.sub(repl, result)
+        lowered = result.lower()
     return result, edits
 
 
@@ -112,17 +108,10 @@ def apply_style(text: str, style: StyleKind) -> tuple[str, list[StyleEditRecord]
     if style == "neutral":
         return text, []
 
-    if style == "formal":
-        return _apply_lexicon(text, FORMAL_MAP, "formal")
-    if style == "casual":
-        return _apply_lexicon(text, CASUAL_MAP, "casual")
-    if style == "academic":
-        return _apply_lexicon(text, ACADEMIC_MAP, "academic")
-    if style == "storytelling":
-        # Storytelling: light touch – ensure narrative connectors; use same formal/casual as base
-        return _apply_lexicon(text, STORYTELLING_MAP, "storytelling")
-    if style == "persuasive":
-        return _apply_lexicon(text, {**PERSUASIVE_MAP, **PERSUASIVE_STRENGTH}, "persuasive")
+    # Lexicons are compiled once at startup (nlp/rules.py)
+    lexicon = get_rules().styles.get(style)
+    if lexicon is not None:
+        return _apply_lexicon(text, lexicon, style)
 
     return text, []
 
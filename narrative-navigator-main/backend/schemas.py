@@ -52,3 +52,19 @@ class EnhanceResponse(BaseModel):
     enhanced_text: str = Field(..., description="Full text after all enhancements and style transform")
     edit_log: list[EditItem] = Field(default_factory=list, description="Ordered list of edits with reasons")
     overall_score: int | None = Field(None, ge=0, le=100, description="Score of enhanced text if computed")
+
+# --- Metrics ---
+
+
+class MemoryMetricsResponse(BaseModel):
+    """Response from GET /metrics: memory state of the shared spaCy pipeline."""
+    generation: int = Field(..., ge=0, description="Pipeline generation; increments on each recycle")
+    vocab_size: int = Field(..., ge=0, description="Lexemes in the current pipeline's Vocab")
+    string_store_size: int = Field(..., ge=0, description="Entries in the current pipeline's StringStore")
+    rss_bytes: int | None = Field(None, ge=0, description="Process resident set size (None if unavailable)")
+    rss_limit_exceeded: bool = Field(False, description="True if RSS is above NN_MAX_RSS_MB")
+    in_flight: int = Field(..., ge=0, description="Requests currently holding a pipeline")
+    retired_pipelines: int = Field(..., ge=0, description="Replaced pipelines still draining in-flight requests")
+    recycles: int = Field(..., ge=0, description="Pipeline recycles since startup")
+    reload_failures: int = Field(0, ge=0, description="Failed pipeline reload attempts since startup")
+    last_recycle_reason: str | None = Field(None, description="Limit that triggered the last recycle")